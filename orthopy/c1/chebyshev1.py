@@ -1,6 +1,9 @@
+import math
+
 import numpy as np
 import sympy
 
+from ..helpers import Eval1D
 from . import gegenbauer
 
 
@@ -54,5 +57,46 @@ class Eval(gegenbauer.Eval):
         if symbolic == "auto":
             symbolic = np.asarray(X).dtype == sympy.Basic
 
-        lmbda = -sympy.S(1) / 2 if symbolic else -0.5
-        super().__init__(X, scaling, lmbda, symbolic)
+        # Still a gegenbauer.Eval, but skip its constructor; it would set up the general
+        # Jacobi coefficients for lambda = -1/2.
+        Eval1D.__init__(self, X, RecurrenceCoefficients(scaling, symbolic))
+
+
+class RecurrenceCoefficients:
+    """Recurrence coefficients of the Chebyshev polynomials of the first kind. These are
+    the Jacobi coefficients for alpha = beta = -1/2, but in closed form; this saves the
+    evaluation of the general Jacobi expressions.
+    """
+
+    def __init__(self, scaling, symbolic):
+        self.scaling = scaling
+        self.frac = sympy.Rational if symbolic else lambda x, y: x / y
+        self.sqrt = sympy.sqrt if symbolic else math.sqrt
+        self.nan = None if symbolic else math.nan
+        self.one = 1 if symbolic else 1.0
+        self.zero = 0 if symbolic else 0.0
+
+        self.int_1 = sympy.pi if symbolic else math.pi
+        self.p0, self.a0 = {
+            "monic": (self.one, self.one),
+            "classical": (self.one, self.frac(1, 2)),
+            "normal": (1 / self.sqrt(self.int_1), self.sqrt(2)),
+        }[scaling]
+
+    def __getitem__(self, N):
+        # Treat N = 0 separately; c[0] is unused, and the general classical formulas
+        # divide by 0 there.
+        if N == 0:
+            return self.a0, self.zero, self.nan
+
+        frac = self.frac
+        if self.scaling == "monic":
+            a = self.one
+            c = frac(1, 2) if N == 1 else frac(1, 4)
+        elif self.scaling == "classical":
+            a = frac(2 * N + 1, N + 1)
+            c = frac((2 * N - 1) * (2 * N + 1), 4 * N * (N + 1))
+        else:
+            a = 2 * self.one
+            c = self.sqrt(2) if N == 1 else self.one
+        return a, self.zero, c
@@ -66,19 +66,63 @@ class RecurrenceCoefficients:
         self.rc = cls(alpha, beta, symbolic)
         self.p0 = self.rc.p0
 
-        gamma = sympy.gamma if symbolic else lambda x: math.gamma(float(x))
-        self.int_1 = (
-            2 ** (alpha + beta + 1)
-            * gamma(alpha + 1)
-            * gamma(beta + 1)
-            / gamma(alpha + beta + 2)
-        )
+        self.int_1 = _int_1(alpha, beta, symbolic)
 
     def __getitem__(self, N):
         return self.rc[N]
 
+    def arrays(self, n):
+        return self.rc.arrays(n)
+
+
+def _int_1(alpha, beta, symbolic):
+    """int_{-1}^{+1} (1-x)^alpha * (1+x)^beta dx"""
+    if symbolic:
+        return (
+            2 ** (alpha + beta + 1)
+            * sympy.gamma(alpha + 1)
+            * sympy.gamma(beta + 1)
+            / sympy.gamma(alpha + beta + 2)
+        )
+    return math.exp(_log_int_1(alpha, beta))
+
 
-class _RCMonic:
+def _log_int_1(alpha, beta):
+    # Evaluate the gamma functions in log-space; they overflow already for moderate
+    # alpha + beta.
+    alpha = float(alpha)
+    beta = float(beta)
+    return (
+        (alpha + beta + 1) * math.log(2)
+        + math.lgamma(alpha + 1)
+        + math.lgamma(beta + 1)
+        - math.lgamma(alpha + beta + 2)
+    )
+
+
+class _RCCached:
+    """Base class for recurrence coefficients which computes every set of coefficients
+    only once.
+    """
+
+    def __getitem__(self, N):
+        try:
+            return self._cache[N]
+        except KeyError:
+            pass
+        out = self._compute(N)
+        self._cache[N] = out
+        return out
+
+    def arrays(self, n):
+        """Return the coefficients a, b, c for N = 0, ..., n-1 as three arrays."""
+        if not self.symbolic:
+            return self._float_arrays(n)
+        coeffs = [self[N] for N in range(n)]
+        return tuple(np.array([coeff[i] for coeff in coeffs]) for i in range(3))
+
+
+class _RCMonic(_RCCached):
     """Generate the recurrence coefficients a_k, b_k, c_k in
 
     P_{k+1}(x) = (a_k x - b_k) * P_{k}(x) - c_k * P_{k-1}(x)
@@ -89,6 +133,7 @@ class _RCMonic:
     """
 
     def __init__(self, alpha, beta, symbolic):
+        self.symbolic = symbolic
         self.alpha = alpha
         self.beta = beta
         self.gamma = sympy.gamma if symbolic else lambda x: math.gamma(float(x))
@@ -98,21 +143,21 @@ class _RCMonic:
         self.one = 1 if symbolic else 1.0
 
         self.p0 = self.one
+        self._cache = {}
 
-    def __getitem__(self, N):
+    def _compute(self, N):
         frac = self.frac
         alpha = self.alpha
         beta = self.beta
+        ab = alpha + beta
+        s = 2 * N + ab
 
         a = self.one
 
         if N == 0:
-            b = frac(beta - alpha, alpha + beta + 2)
+            b = frac(beta - alpha, ab + 2)
         else:
-            b = frac(
-                beta ** 2 - alpha ** 2,
-                (2 * N + alpha + beta) * (2 * N + alpha + beta + 2),
-            )
+            b = frac(beta ** 2 - alpha ** 2, s * (s + 2))
 
         # Note that we have the treat the case N==1 separately to avoid division by 0
         # for alpha=beta=-1/2.
@@ -126,118 +171,184 @@ class _RCMonic:
             # This is bad practice; the value could accidentally be used.
             c = self.nan
         elif N == 1:
-            c = frac(
-                4 * (1 + alpha) * (1 + beta),
-                (2 + alpha + beta) ** 2 * (3 + alpha + beta),
-            )
+            c = frac(4 * (1 + alpha) * (1 + beta), (2 + ab) ** 2 * (3 + ab))
         else:
             c = frac(
-                4 * (N + alpha) * (N + beta) * N * (N + alpha + beta),
-                (2 * N + alpha + beta) ** 2
-                * (2 * N + alpha + beta + 1)
-                * (2 * N + alpha + beta - 1),
+                4 * (N + alpha) * (N + beta) * N * (N + ab),
+                s ** 2 * (s + 1) * (s - 1),
             )
         return a, b, c
 
+    def _float_arrays(self, n):
+        alpha = self.alpha
+        beta = self.beta
+        ab = alpha + beta
+
+        N = np.arange(n, dtype=float)
+        s = 2 * N + ab
+
+        a = np.ones(n)
+
+        b = np.empty(n)
+        b[:1] = (beta - alpha) / (ab + 2)
+        b[1:] = (beta ** 2 - alpha ** 2) / (s[1:] * (s[1:] + 2))
+
+        c = np.empty(n)
+        c[:1] = math.nan
+        c[1:2] = 4 * (1 + alpha) * (1 + beta) / ((2 + ab) ** 2 * (3 + ab))
+        N = N[2:]
+        s = s[2:]
+        c[2:] = (
+            4 * (N + alpha) * (N + beta) * N * (N + ab) / (s ** 2 * (s + 1) * (s - 1))
+        )
+        return a, b, c
+
 
-class _RCClassical:
+class _RCClassical(_RCCached):
     def __init__(self, alpha, beta, symbolic):
+        self.symbolic = symbolic
         self.frac = sympy.Rational if symbolic else lambda x, y: x / y
         self.nan = None if symbolic else math.nan
         self.alpha = alpha
         self.beta = beta
 
         self.p0 = 1 if symbolic else 1.0
+        self._cache = {}
 
-    def __getitem__(self, N):
+    def _compute(self, N):
         frac = self.frac
         alpha = self.alpha
         beta = self.beta
+        ab = alpha + beta
 
         # Treat N = 0 separately to avoid division by 0 for alpha = beta = -1/2.
         if N == 0:
-            a = frac(alpha + beta + 2, 2)
+            a = frac(ab + 2, 2)
             b = frac(beta - alpha, 2)
             c = self.nan
         else:
-            a = frac(
-                (2 * N + alpha + beta + 1) * (2 * N + alpha + beta + 2),
-                2 * (N + 1) * (N + alpha + beta + 1),
-            )
-            b = frac(
-                (beta ** 2 - alpha ** 2) * (2 * N + alpha + beta + 1),
-                2 * (N + 1) * (N + alpha + beta + 1) * (2 * N + alpha + beta),
-            )
-            c = frac(
-                (N + alpha) * (N + beta) * (2 * N + alpha + beta + 2),
-                (N + 1) * (N + alpha + beta + 1) * (2 * N + alpha + beta),
-            )
+            s = 2 * N + ab
+            q = (N + 1) * (N + ab + 1)
+            a = frac((s + 1) * (s + 2), 2 * q)
+            b = frac((beta ** 2 - alpha ** 2) * (s + 1), 2 * q * s)
+            c = frac((N + alpha) * (N + beta) * (s + 2), q * s)
 
         return a, b, c
 
+    def _float_arrays(self, n):
+        alpha = self.alpha
+        beta = self.beta
+        ab = alpha + beta
+
+        a = np.empty(n)
+        b = np.empty(n)
+        c = np.empty(n)
+
+        a[:1] = (ab + 2) / 2
+        b[:1] = (beta - alpha) / 2
+        c[:1] = math.nan
+
+        N = np.arange(1, n, dtype=float)
+        s = 2 * N + ab
+        q = (N + 1) * (N + ab + 1)
+        a[1:] = (s + 1) * (s + 2) / (2 * q)
+        b[1:] = (beta ** 2 - alpha ** 2) * (s + 1) / (2 * q * s)
+        c[1:] = (N + alpha) * (N + beta) * (s + 2) / (q * s)
+        return a, b, c
+
 
-class _RCNormal:
+class _RCNormal(_RCCached):
     def __init__(self, alpha, beta, symbolic):
+        self.symbolic = symbolic
         self.frac = sympy.Rational if symbolic else lambda x, y: x / y
         self.sqrt = sympy.sqrt if symbolic else math.sqrt
         self.nan = None if symbolic else math.nan
         self.alpha = alpha
         self.beta = beta
 
-        gamma = sympy.gamma if symbolic else lambda x: math.gamma(float(x))
-        self.int_1 = (
-            2 ** (alpha + beta + 1)
-            * gamma(alpha + 1)
-            * gamma(beta + 1)
-            / gamma(alpha + beta + 2)
-        )
-        self.p0 = self.sqrt(1 / self.int_1)
+        if symbolic:
+            self.int_1 = _int_1(alpha, beta, symbolic)
+            self.p0 = self.sqrt(1 / self.int_1)
+        else:
+            log_int_1 = _log_int_1(alpha, beta)
+            self.int_1 = math.exp(log_int_1)
+            self.p0 = math.exp(-0.5 * log_int_1)
+        self._cache = {}
 
-    def __getitem__(self, N):
+    def _compute(self, N):
         frac = self.frac
         sqrt = self.sqrt
         alpha = self.alpha
         beta = self.beta
+        ab = alpha + beta
+        s = 2 * N + ab
+        q = (N + 1) * (N + alpha + 1) * (N + beta + 1) * (N + ab + 1)
 
         # Treat N==0 separately to avoid division by 0 for alpha=beta=-1/2 (Chebyshev 1)
         # and alpha=beta=0 (Legendre).
         if N == 0:
-            t = sqrt(frac(alpha + beta + 3, (alpha + 1) * (beta + 1)))
-            a = frac(alpha + beta + 2, 2) * t
+            t = sqrt(frac(ab + 3, (alpha + 1) * (beta + 1)))
+            a = frac(ab + 2, 2) * t
             b = frac(beta - alpha, 2) * t
         else:
-            t = sqrt(
-                frac(
-                    (2 * N + alpha + beta + 1) * (2 * N + alpha + beta + 3),
-                    (N + 1) * (N + alpha + 1) * (N + beta + 1) * (N + alpha + beta + 1),
-                )
-            )
-            a = frac(2 * N + alpha + beta + 2, 2) * t
-            b = frac(beta ** 2 - alpha ** 2, 2 * (2 * N + alpha + beta)) * t
+            t = sqrt(frac((s + 1) * (s + 3), q))
+            a = frac(s + 2, 2) * t
+            b = frac(beta ** 2 - alpha ** 2, 2 * s) * t
 
         if N == 0:
             c = self.nan
         elif N == 1:
-            c = frac(4 + alpha + beta, 2 + alpha + beta) * sqrt(
+            c = frac(4 + ab, 2 + ab) * sqrt(
                 frac(
-                    (1 + alpha) * (1 + beta) * (5 + alpha + beta),
-                    2 * (2 + alpha) * (2 + beta) * (2 + alpha + beta),
+                    (1 + alpha) * (1 + beta) * (5 + ab),
+                    2 * (2 + alpha) * (2 + beta) * (2 + ab),
                 )
             )
         else:
-            c = frac(2 * N + alpha + beta + 2, 2 * N + alpha + beta) * sqrt(
-                frac(
-                    N
-                    * (N + alpha)
-                    * (N + beta)
-                    * (N + alpha + beta)
-                    * (2 * N + alpha + beta + 3),
-                    (N + 1)
-                    * (N + alpha + 1)
-                    * (N + beta + 1)
-                    * (N + alpha + beta + 1)
-                    * (2 * N + alpha + beta - 1),
-                )
+            c = frac(s + 2, s) * sqrt(
+                frac(N * (N + alpha) * (N + beta) * (N + ab) * (s + 3), q * (s - 1))
             )
 
         return a, b, c
+
+    def _float_arrays(self, n):
+        alpha = self.alpha
+        beta = self.beta
+        ab = alpha + beta
+
+        N = np.arange(n, dtype=float)
+        s = 2 * N + ab
+        q = (N + 1) * (N + alpha + 1) * (N + beta + 1) * (N + ab + 1)
+
+        t = np.empty(n)
+        t[:1] = math.sqrt((ab + 3) / ((alpha + 1) * (beta + 1)))
+        t[1:] = np.sqrt((s[1:] + 1) * (s[1:] + 3) / q[1:])
+
+        a = (s + 2) / 2 * t
+
+        b = np.empty(n)
+        b[:1] = (beta - alpha) / 2
+        b[1:] = (beta ** 2 - alpha ** 2) / (2 * s[1:])
+        b *= t
+
+        c = np.empty(n)
+        c[:1] = math.nan
+        c[1:2] = (
+            (4 + ab)
+            / (2 + ab)
+            * math.sqrt(
+                (1 + alpha)
+                * (1 + beta)
+                * (5 + ab)
+                / (2 * (2 + alpha) * (2 + beta) * (2 + ab))
+            )
+        )
+        N = N[2:]
+        s = s[2:]
+        q = q[2:]
+        c[2:] = (
+            (s + 2)
+            / s
+            * np.sqrt(N * (N + alpha) * (N + beta) * (N + ab) * (s + 3) / (q * (s - 1)))
+        )
+        return a, b, c
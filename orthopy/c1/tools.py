@@ -1,6 +1,3 @@
-import numpy as np
-
-
 def clenshaw(a, alpha, beta, t):
     """Clenshaw's algorithm for evaluating
 
@@ -15,21 +12,14 @@ def clenshaw(a, alpha, beta, t):
     assert len(beta) == n
     assert len(a) == n + 1
 
-    try:
-        b = np.empty((n + 1,) + t.shape)
-    except AttributeError:  # 'float' object has no attribute 'shape'
-        b = np.empty(n + 1)
-
-    # b[0] is unused, can be any value
-    # TODO shift the array
-    b[0] = 1.0
-
-    b[n] = a[n]
-    b[n - 1] = a[n - 1] + (t - alpha[n - 1]) * b[n]
-    for k in range(n - 2, 0, -1):
-        b[k] = a[k] + (t - alpha[k]) * b[k + 1] - beta[k + 1] * b[k + 2]
+    assert n > 0
 
-    phi0 = 1.0
-    phi1 = t - alpha[0]
+    # b_k only depends on b_{k+1} and b_{k+2}, so only keep those two around instead of
+    # all of b.
+    b2 = a[n]
+    b1 = a[n - 1] + (t - alpha[n - 1]) * b2
+    for k in range(n - 2, -1, -1):
+        b1, b2 = a[k] + (t - alpha[k]) * b1 - beta[k + 1] * b2, b1
 
-    return phi0 * a[0] + phi1 * b[1] - beta[1] * phi0 * b[2]
+    # S(t) = P_0(t) * b_0 with P_0 = 1
+    return b1
@@ -16,6 +16,10 @@ class Eval1D:
         self.x = x
         self.k = 0
         self.last = [None, None]
+        # For floating-point arrays, the recurrence can be evaluated with in-place
+        # operations on a single fresh buffer per level. Scalars, integer arrays, and
+        # symbolic input (object arrays, sympy.Poly) take the generic path.
+        self._inplace = isinstance(x, np.ndarray) and x.dtype.kind in "fc"
 
     def __iter__(self):
         return self
@@ -23,6 +27,15 @@ class Eval1D:
     def __next__(self):
         if self.k == 0:
             out = full_like(self.x, self.rc.p0)
+        elif self._inplace:
+            a, b, c = self.rc[self.k - 1]
+            # The returned arrays are handed out to the caller, so `out` must not
+            # share memory with any of the previous levels.
+            out = np.multiply(self.x, a)
+            out -= b
+            out *= self.last[0]
+            if self.k > 1:
+                out -= np.multiply(self.last[1], c)
         else:
             a, b, c = self.rc[self.k - 1]
             out = self.last[0] * (self.x * a - b)
@@ -110,16 +123,25 @@ class ProductEvalWithDegrees:
             b = self.b
             c = self.c
 
-            values = []
-            degrees = []
+            last_degrees = self.last_degrees[0]
+
+            # The new level is made up of `dim` blocks, block `i` consisting of all
+            # entries of the previous level where the first `i` degrees are 0. With the
+            # block sizes known upfront, all blocks can be written into one buffer
+            # instead of being concatenated.
+            leading_zeros = np.cumprod(last_degrees == 0, axis=1)
+            n = len(last_degrees) + np.sum(leading_zeros[:, : dim - 1])
+            values = None
+            degrees = np.empty((n, dim), dtype=last_degrees.dtype)
+            offset = 0
 
-            mask0 = np.ones(len(self.last_degrees[0]), dtype=bool)
+            mask0 = np.ones(len(last_degrees), dtype=bool)
             if self.L > 1:
                 mask1 = np.ones(len(self.last_degrees[1]), dtype=bool)
 
             for i in range(dim):
                 lv0 = self.last_values[0][mask0]
-                idx0 = self.last_degrees[0][mask0][:, i]
+                idx0 = last_degrees[mask0][:, i]
 
                 val = lv0 * (np.multiply.outer(a[idx0], X[i]).T - b[idx0]).T
 
@@ -129,19 +151,20 @@ class ProductEvalWithDegrees:
                     yy = idx1 + 1 > 0
                     val[: len(idx1)][yy] -= (lv1[yy].T * c[idx1[yy] + 1]).T
 
-                values.append(val)
+                if values is None:
+                    values = np.empty((n,) + val.shape[1:], dtype=val.dtype)
+                block = slice(offset, offset + len(val))
+                values[block] = val
+
+                degrees[block] = last_degrees[mask0]
+                degrees[block, i] += 1
+                offset += len(val)
 
-                deg = self.last_degrees[0][mask0]
-                deg[:, i] += 1
-                degrees.append(deg)
                 # mask is True for all entries where the first `i` degrees are 0
-                mask0 &= self.last_degrees[0][:, i] == 0
+                mask0 &= last_degrees[:, i] == 0
                 if self.L > 1:
                     mask1 &= self.last_degrees[1][:, i] == 0
 
-            values = np.concatenate(values)
-            degrees = np.concatenate(degrees)
-
         self.last_values[1] = self.last_values[0]
         self.last_values[0] = values
 
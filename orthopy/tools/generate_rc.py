@@ -40,7 +40,9 @@ def golub_welsch(moments):
     assert len(moments) % 2 == 1
     n = (len(moments) - 1) // 2
 
-    M = np.array([[moments[i + j] for j in range(n + 1)] for i in range(n + 1)])
+    # Hankel matrix of the moments, M[i, j] = moments[i + j]
+    i = np.arange(n + 1)
+    M = np.asarray(moments)[np.add.outer(i, i)]
     R = np.linalg.cholesky(M).T
 
     # (upper) diagonal
@@ -113,33 +115,62 @@ def chebyshev_modified(nu, recurrence_coefficients):
 
     n = m // 2
 
+    # Fetch all recurrence coefficients at once instead of once per iteration.
+    if hasattr(recurrence_coefficients, "arrays"):
+        _, a, b = recurrence_coefficients.arrays(m)
+    else:
+        _, a, b = np.array([recurrence_coefficients[i] for i in range(m)]).T
+
+    # Only the rows k, k-1, k-2 of the (n, 2n)-matrix sigma are needed at any time, so
+    # keep them in a rolling buffer. Row k occupies the columns k, ..., 2n-k-1.
+    # The entries of sigma are fractions even for integer moments and coefficients,
+    # so promote to at least float. Symbolic data stays object.
+    nu = np.asarray(nu)
+    dtype = np.result_type(nu, a, b, 1.0)
+    sigma = np.empty((3, m), dtype=dtype)
+
     alpha = []
     beta = []
-    sigma = [None, None, None]
     int_1 = nu[0]
 
     if n > 0:
-        k = 0
-        sigma[0] = np.asarray(nu)
-        _, a0, _ = recurrence_coefficients[0]
-        alpha.append(a0 + nu[1] / nu[0])
+        sigma[0] = nu
+        alpha.append(a[0] + nu[1] / nu[0])
         beta.append(math.nan)
 
-    for k in range(1, n):
-        sigma[2], sigma[1] = sigma[1], sigma[0]
+    # For floating-point data, update sigma with in-place operations and one scratch
+    # buffer instead of creating a temporary for every term. Symbolic data (object
+    # arrays) takes the plain path.
+    inplace = dtype.kind in "fc"
+    if inplace:
+        scratch = np.empty(m, dtype=dtype)
 
-        _, aL, bL = np.array(
-            [recurrence_coefficients[i] for i in range(k, 2 * n - k)]
-        ).T
-        sigma[0] = (
-            sigma[0][2:] - (alpha[k - 1] - aL) * sigma[0][1:-1] + bL * sigma[1][:-2]
-        )
-        if k > 1:
-            sigma[0] -= beta[k - 1] * sigma[2][2:-2]
+    for k in range(1, n):
+        s0 = sigma[k % 3]
+        s1 = sigma[(k - 1) % 3]
+        s2 = sigma[(k - 2) % 3]
+
+        L = slice(k, m - k)
+        if inplace:
+            out = s0[L]
+            tmp = scratch[: m - 2 * k]
+            np.subtract(a[L], alpha[k - 1], out=out)
+            out *= s1[L]
+            out += s1[k + 1 : m - k + 1]
+            out += np.multiply(b[L], s1[k - 1 : m - k - 1], out=tmp)
+            if k > 1:
+                out -= np.multiply(beta[k - 1], s2[L], out=tmp)
+        else:
+            s0[L] = (
+                s1[k + 1 : m - k + 1]
+                - (alpha[k - 1] - a[L]) * s1[L]
+                + b[L] * s1[k - 1 : m - k - 1]
+            )
+            if k > 1:
+                s0[L] -= beta[k - 1] * s2[L]
 
-        ak = aL[0]
-        alpha.append(ak + sigma[0][1] / sigma[0][0] - sigma[1][1] / sigma[1][0])
-        beta.append(sigma[0][0] / sigma[1][0])
+        alpha.append(a[k] + s0[k + 1] / s0[k] - s1[k] / s1[k - 1])
+        beta.append(s0[k] / s1[k - 1])
 
     return np.asarray(alpha), np.asarray(beta), int_1
 
@@ -151,26 +182,34 @@ def gautschi_test_3(moments, alpha, beta):
     n = len(alpha)
     assert len(beta) == n
 
-    D = np.empty(n + 1)
-    Dp = np.empty(n + 1)
-    D[0] = 1.0
-    D[1] = moments[0]
-    Dp[0] = 0.0
-    Dp[1] = moments[1]
-    for k in range(2, n + 1):
-        A = np.array([moments[i : i + k] for i in range(k)])
-        D[k] = np.linalg.det(A)
-        #
+    # D[k] is the determinant of the k x k Hankel matrix of the moments, Dp[k] the same
+    # with the last column shifted by one. Work with the logarithms of the
+    # determinants; the determinants themselves quickly over- or underflow.
+    moments = np.asarray(moments)
+    idx = np.arange(n)
+    H = moments[np.add.outer(idx, idx)]
+
+    sign_D = np.empty(n + 1)
+    log_D = np.empty(n + 1)
+    sign_Dp = np.empty(n + 1)
+    log_Dp = np.empty(n + 1)
+    sign_D[0], log_D[0] = 1.0, 0.0
+    sign_Dp[0], log_Dp[0] = 0.0, -np.inf
+    for k in range(1, n + 1):
+        A = H[:k, :k].copy()
+        sign_D[k], log_D[k] = np.linalg.slogdet(A)
         A[:, -1] = moments[k : 2 * k]
-        Dp[k] = np.linalg.det(A)
+        sign_Dp[k], log_Dp[k] = np.linalg.slogdet(A)
 
-    errors_alpha = np.zeros(n)
-    errors_beta = np.zeros(n)
+    # Dp[k] / D[k]
+    q = sign_Dp * sign_D * np.exp(log_Dp - log_D)
 
-    errors_alpha[0] = abs(alpha[0] - (Dp[1] / D[1] - Dp[0] / D[0]))
-    errors_beta[0] = abs(beta[0] - D[1])
-    for k in range(1, n):
-        errors_alpha[k] = abs(alpha[k] - (Dp[k + 1] / D[k + 1] - Dp[k] / D[k]))
-        errors_beta[k] = abs(beta[k] - D[k + 1] * D[k - 1] / D[k] ** 2)
+    errors_alpha = abs(np.asarray(alpha) - (q[1:] - q[:-1]))
+
+    errors_beta = np.empty(n)
+    errors_beta[0] = abs(beta[0] - sign_D[1] * np.exp(log_D[1]))
+    # D[k + 1] * D[k - 1] / D[k] ** 2
+    r = sign_D[2:] * sign_D[:-2] * np.exp(log_D[2:] + log_D[:-2] - 2 * log_D[1:-1])
+    errors_beta[1:] = abs(np.asarray(beta[1:]) - r)
 
     return errors_alpha, errors_beta
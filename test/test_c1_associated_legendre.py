@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 import pytest
 import sympy
@@ -5,8 +7,18 @@ import sympy
 import orthopy
 
 
-# https://en.wikipedia.org/wiki/Associated_Legendre_polynomials#The_first_few_associated_Legendre_functions
 def exact_natural(x):
+    # Memoize the symbolic computation across the parametrized tests. Arrays aren't
+    # hashable, so pass the entries and the shape instead. Return a copy since the
+    # cached table is mutable.
+    return _exact_natural(tuple(np.ravel(x)), np.shape(x)).copy()
+
+
+# https://en.wikipedia.org/wiki/Associated_Legendre_polynomials#The_first_few_associated_Legendre_functions
+@functools.lru_cache(maxsize=None)
+def _exact_natural(x_flat, shape):
+    x = np.array(x_flat, dtype=object).reshape(shape) if shape else x_flat[0]
+
     sqrt = np.vectorize(sympy.sqrt)
     sqrt1mx2 = sqrt(1 - x ** 2)
 
@@ -40,13 +52,14 @@ def exact_natural(x):
     p4m3 = -p4p3 / 5040
     p4m4 = +p4p4 / 40320
 
-    return [
-        [p0_0],
-        [p1m1, p1_0, p1p1],
-        [p2m2, p2m1, p2_0, p2p1, p2p2],
-        [p3m3, p3m2, p3m1, p3_0, p3p1, p3p2, p3p3],
-        [p4m4, p4m3, p4m2, p4m1, p4_0, p4p1, p4p2, p4p3, p4p4],
-    ]
+    # P_L^m is stored in table[L, m + 4]; entries outside of the triangle are nan.
+    table = np.full((5, 9) + np.shape(x), sympy.nan, dtype=object)
+    table[0, 4] = p0_0
+    table[1, 3:6] = [p1m1, p1_0, p1p1]
+    table[2, 2:7] = [p2m2, p2m1, p2_0, p2p1, p2p2]
+    table[3, 1:8] = [p3m3, p3m2, p3m1, p3_0, p3p1, p3p2, p3p3]
+    table[4, 0:9] = [p4m4, p4m3, p4m2, p4m1, p4_0, p4p1, p4p2, p4p3, p4p4]
+    return table
 
 
 np.random.seed(10)
@@ -59,6 +72,13 @@ def ff(l, m):
     return sympy.prod([l - abs(m) + 1 + i for i in range(2 * abs(m))])
 
 
+def scale_table(factor):
+    """factor(L, m) in the layout of exact_natural(), zero outside of the triangle"""
+    L, m = np.meshgrid(np.arange(5), np.arange(-4, 5), indexing="ij")
+    table = np.frompyfunc(factor, 2, 1)(L, m)
+    return np.where(abs(m) <= L, table, 0)
+
+
 @pytest.mark.parametrize(
     "x",
     [
@@ -68,10 +88,13 @@ def ff(l, m):
     ],
 )
 @pytest.mark.parametrize(
-    "scaling,factor",
+    "scaling,scale",
     [
-        ("classical", lambda L, m: 1),
-        ("normal", lambda L, m: sympy.sqrt(sympy.S(2 * L + 1) / 2 * ff(L, m))),
+        ("classical", scale_table(lambda L, m: 1)),
+        (
+            "normal",
+            scale_table(lambda L, m: sympy.sqrt(sympy.S(2 * L + 1) / 2 * ff(L, m))),
+        ),
         # TODO move these to u3
         # (
         #     "spherical",
@@ -81,20 +104,15 @@ def ff(l, m):
         # ("schmidt", lambda L, m: 2 * sympy.sqrt(ff(L, m))),
     ],
 )
-def test_exact(x, scaling, factor):
+def test_exact(x, scaling, scale):
     """Test for the exact values."""
     evaluator = orthopy.c1.associated_legendre.Eval(x, scaling)
 
-    exacts = exact_natural(x)
-    exacts = [
-        [val * factor(L, m - L) for m, val in enumerate(ex)]
-        for L, ex in enumerate(exacts)
-    ]
+    exacts = exact_natural(x) * scale.reshape(scale.shape + (1,) * np.ndim(x))
 
-    for ex in exacts:
+    for L in range(5):
         val = next(evaluator)
-        for v, e in zip(val, ex):
-            assert np.all(v == e)
+        assert np.all(val == exacts[L, 4 - L : 5 + L])
 
 
 def test_show(n=2):
@@ -152,6 +152,34 @@ def test_eval(t, ref, tol=1.0e-14):
     assert np.all(value == ref)
 
 
+@pytest.mark.parametrize("scaling", ["monic", "classical", "normal"])
+def test_recurrence_coefficients(scaling, n=7, tol=1.0e-14):
+    # compare with the general Jacobi coefficients
+    rc = orthopy.c1.chebyshev1.RecurrenceCoefficients(scaling, symbolic=True)
+    ref = orthopy.c1.jacobi.RecurrenceCoefficients(
+        scaling, -Rational(1, 2), -Rational(1, 2), symbolic=True
+    )
+    assert rc.p0 == ref.p0
+    assert rc.int_1 == ref.int_1
+    assert rc[0][2] is None
+    for k in range(n):
+        for val, r in zip(rc[k], ref[k]):
+            if r is not None:
+                assert sympy.simplify(val - r) == 0
+
+    rc = orthopy.c1.chebyshev1.RecurrenceCoefficients(scaling, symbolic=False)
+    ref = orthopy.c1.jacobi.RecurrenceCoefficients(scaling, -0.5, -0.5, symbolic=False)
+    assert abs(rc.p0 - ref.p0) < tol
+    assert np.isnan(rc[0][2])
+    vals = np.array([rc[k] for k in range(n)])
+    assert np.all(np.abs(vals[1:] - np.array([ref[k] for k in range(1, n)])) < tol)
+    assert np.all(np.abs(vals[0, :2] - ref[0][:2]) < tol)
+
+    # still a specialization of Gegenbauer
+    evaluator = orthopy.c1.chebyshev1.Eval(0.5, scaling)
+    assert isinstance(evaluator, orthopy.c1.gegenbauer.Eval)
+
+
 def test_show(n=5):
     orthopy.c1.chebyshev1.show(n, "normal")
     orthopy.c1.chebyshev1.savefig("chebyshev1.svg", n, "normal")
@@ -1,3 +1,4 @@
+import itertools
 import math
 
 import numpy as np
@@ -46,6 +47,23 @@ def test_jacobi_monic(scaling, n, y):
     assert all(val == y)
 
 
+@pytest.mark.parametrize("scaling", ["monic", "classical", "normal"])
+def test_jacobi_float(scaling, n=5, tol=1.0e-13):
+    x = np.array([0, S(1) / 2, 1])
+    alpha = 3
+    beta = 2
+
+    ref = list(itertools.islice(orthopy.c1.jacobi.Eval(x, scaling, alpha, beta), n + 1))
+    vals = list(
+        itertools.islice(
+            orthopy.c1.jacobi.Eval(x.astype(float), scaling, alpha, beta), n + 1
+        )
+    )
+    # make sure all levels are still intact after the iteration
+    for val, r in zip(vals, ref):
+        assert np.all(np.abs(val - r.astype(float)) < tol * np.abs(r.astype(float)))
+
+
 @pytest.mark.parametrize("symbolic", [True, False])
 def test_jacobi(symbolic):
     n = 5
@@ -65,6 +83,50 @@ def test_jacobi(symbolic):
         assert np.all(np.abs(gamma[1:] - ref_gamma[1:]) < tol)
 
 
+@pytest.mark.parametrize("scaling", ["monic", "classical", "normal"])
+@pytest.mark.parametrize("alpha, beta", [(3, 2), (0, 0), (-0.5, -0.5)])
+def test_arrays(scaling, alpha, beta, n=7, tol=1.0e-14):
+    rc = orthopy.c1.jacobi.RecurrenceCoefficients(scaling, alpha, beta, False)
+    ref = np.array([rc[k] for k in range(n)]).T
+
+    vals = np.array(rc.arrays(n))
+    assert vals.shape == (3, n)
+    assert math.isnan(vals[2, 0])
+    vals[2, 0] = ref[2, 0] = 0.0
+    assert np.all(np.abs(vals - ref) < tol * (1.0 + np.abs(ref)))
+
+    # symbolic
+    rc = orthopy.c1.jacobi.RecurrenceCoefficients(scaling, alpha, beta, True)
+    a, b, c = rc.arrays(n)
+    assert c[0] is None
+    for i, val in enumerate([a, b, c]):
+        assert all(v == rc[k][i] for k, v in enumerate(val))
+
+
+@pytest.mark.parametrize("scaling", ["monic", "classical", "normal"])
+def test_array_parameters(scaling, n=5):
+    # 0-d arrays as alpha, beta
+    x = np.array([-0.3, 0.1, 0.8])
+    ref = list(itertools.islice(orthopy.c1.jacobi.Eval(x, scaling, 0.5, 1.5), n + 1))
+    vals = list(
+        itertools.islice(
+            orthopy.c1.jacobi.Eval(x, scaling, np.array(0.5), np.array(1.5)), n + 1
+        )
+    )
+    for val, r in zip(vals, ref):
+        assert np.all(np.abs(val - r) < 1.0e-14 * (1.0 + np.abs(r)))
+
+
+@pytest.mark.parametrize("alpha, beta", [(3, 2), (200, 150)])
+def test_int_1(alpha, beta, tol=1.0e-12):
+    rc = orthopy.c1.jacobi.RecurrenceCoefficients("normal", alpha, beta, False)
+    ref = orthopy.c1.jacobi.RecurrenceCoefficients("normal", alpha, beta, True)
+
+    # plain gamma() overflows for the larger parameters
+    assert abs(rc.int_1 - float(ref.int_1)) < tol * float(ref.int_1)
+    assert abs(rc.p0 - float(ref.p0)) < tol * float(ref.p0)
+
+
 def test_show(n=5):
     orthopy.c1.jacobi.show(n, "normal", 0, 0)
     orthopy.c1.jacobi.savefig("jacobi.svg", n, "normal", 0, 0)
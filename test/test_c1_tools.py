@@ -1,6 +1,7 @@
 import math
 
 import numpy as np
+import pytest
 from scipy.special import legendre
 
 import orthopy
@@ -20,5 +21,26 @@ def test_clenshaw(tol=1.0e-14):
     assert abs(value - ref) < tol
 
 
+@pytest.mark.parametrize("n", [1, 2, 5])
+def test_clenshaw_array(n, tol=1.0e-14):
+    rc = orthopy.c1.jacobi.RecurrenceCoefficients("monic", 0, 0, symbolic=False)
+    _, alpha, beta = rc.arrays(n)
+
+    t = np.linspace(-1.0, 1.0, 11)
+
+    a = np.arange(1.0, n + 2)
+    value = orthopy.c1.clenshaw(a, alpha, beta, t)
+
+    ref = sum(a[i] * np.polyval(legendre(i, monic=True), t) for i in range(n + 1))
+    assert value.shape == t.shape
+    assert np.all(abs(value - ref) < tol * (1.0 + abs(ref)))
+
+
+def test_clenshaw_empty():
+    # S(t) = a_0 has no recurrence coefficients
+    with pytest.raises(AssertionError):
+        orthopy.c1.clenshaw(np.ones(1), [], [], np.linspace(-1.0, 1.0, 11))
+
+
 if __name__ == "__main__":
     test_clenshaw()
@@ -44,7 +44,9 @@ def test_golub_welsch(tol=1.0e-14):
     assert abs(beta[4] - 16.0 / 99.0) < tol
     assert abs(int_1 - math.sqrt(2.0 / 3.0)) < tol
 
-    orthopy.tools.gautschi_test_3(moments, alpha, beta)
+    errors_alpha, errors_beta = orthopy.tools.gautschi_test_3(moments, alpha, beta)
+    assert np.all(errors_alpha < tol)
+    assert np.all(errors_beta[1:] < tol)
 
 
 @pytest.mark.parametrize("dtype", [np.float, sympy.S])
@@ -86,6 +88,17 @@ def test_chebyshev(dtype):
         assert abs(int_1 - 2 / 3) < tol
 
 
+def test_chebyshev_integer_moments(tol=1.0e-14):
+    # moments of the weight function exp(-x^2/2) / sqrt(2*pi)
+    moments = np.array([1, 0, 1, 0, 3, 0, 15, 0, 105, 0])
+    alpha, beta, int_1 = orthopy.tools.chebyshev(moments)
+
+    assert np.all(abs(alpha) < tol)
+    assert np.isnan(beta[0])
+    assert np.all(abs(beta[1:] - [1, 2, 3, 4]) < tol)
+    assert int_1 == 1
+
+
 def test_chebyshev_modified(tol=1.0e-14):
     alpha = 2.0
 
@@ -108,3 +121,19 @@ def test_chebyshev_modified(tol=1.0e-14):
     assert math.isnan(beta[0])
     assert np.all(abs(beta[1:] - [3 / 5, 4 / 35, 25 / 63, 16 / 99]) < tol)
     assert abs(int_1 - 2 / 3) < tol
+
+
+def test_chebyshev_modified_legendre(n=30, tol=1.0e-13):
+    # The modified moments of the Legendre weight with respect to the Legendre
+    # polynomials themselves are 2, 0, 0, ...; this recovers the Legendre recurrence
+    # coefficients.
+    moments = np.zeros(2 * n)
+    moments[0] = 2.0
+
+    rc = orthopy.c1.legendre.RecurrenceCoefficients("monic", symbolic=False)
+    alpha, beta, int_1 = orthopy.tools.chebyshev_modified(moments, rc)
+
+    _, ref_alpha, ref_beta = rc.arrays(n)
+    assert np.all(abs(alpha - ref_alpha) < tol)
+    assert np.all(abs(beta[1:] - ref_beta[1:]) < tol)
+    assert abs(int_1 - 2.0) < tol
@@ -76,6 +76,13 @@ def test_schmidt_seminormality(n=3):
             assert _integrate_poly(val * _conj(val)) == ref
 
 
+# Unlike numpy.vectorize, frompyfunc doesn't call the function once more to probe the
+# output type.
+_sin = np.frompyfunc(sympy.sin, 1, 1)
+_cos = np.frompyfunc(sympy.cos, 1, 1)
+_exp = np.frompyfunc(sympy.exp, 1, 1)
+
+
 def sph_exact2(theta_phi):
     # Exact values from
     # <https://en.wikipedia.org/wiki/Table_of_spherical_harmonics>.
@@ -84,12 +91,13 @@ def sph_exact2(theta_phi):
     except AttributeError:
         y0_0 = sqrt(1 / pi) / 2
 
-    sin = np.vectorize(sympy.sin)
-    cos = np.vectorize(sympy.cos)
-    exp = np.vectorize(sympy.exp)
-
     theta, phi = theta_phi
 
+    if np.ndim(theta) == 0:
+        sin, cos, exp = sympy.sin, sympy.cos, sympy.exp
+    else:
+        sin, cos, exp = _sin, _cos, _exp
+
     sin_theta = sin(theta)
     cos_theta = cos(theta)
 